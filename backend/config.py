@@ -48,6 +48,8 @@ class AppConfig:
     # Database Settings
     database_url: str = "sqlite:///data/learning.db"
     sql_echo: bool = False
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
 
     # Server Settings
     flask_host: str = "0.0.0.0"
@@ -73,6 +75,8 @@ class AppConfig:
                 os.getenv("LEARNING_DATABASE_URL", "sqlite:///data/learning.db")
             ),
             sql_echo=os.getenv("SQL_ECHO", "false").lower() == "true",
+            db_pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+            db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
             flask_host=os.getenv("FLASK_HOST", "0.0.0.0"),
             flask_port=int(os.getenv("FLASK_PORT", "8000")),
             flask_debug=os.getenv("FLASK_DEBUG", "false").lower() == "true",
@@ -87,6 +91,10 @@ class AppConfig:
         """Validate configuration values."""
         if self.flask_port <= 0 or self.flask_port > 65535:
             raise ConfigurationError("flask_port", "Must be between 1 and 65535")
+        if self.db_pool_size <= 0:
+            raise ConfigurationError("db_pool_size", "Must be at least 1")
+        if self.db_max_overflow < 0:
+            raise ConfigurationError("db_max_overflow", "Must not be negative")
 
 
 # Global configuration instance
@@ -2,13 +2,17 @@
 Static defaults and constants for Ariel Learning App.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List
 
 # App version (single source of truth)
-APP_VERSION = "3.0.4"
+APP_VERSION = "3.0.5"
 
 # Recent changelog entries (shown in "What's New" popup)
 APP_CHANGELOG: List[Dict[str, str]] = [
+    {
+        "version": "3.0.5",
+        "text": "שיפורי מהירות ויציבות: ההתקדמות והמשחקים נטענים מהר יותר ⚡",
+    },
     {
         "version": "3.0.4",
         "text": "תיקון: לחיצה על סבב חדש מנקה גם את הסימון הירוק בבחירת שיעור ✅",
@@ -45,10 +49,6 @@ APP_CHANGELOG: List[Dict[str, str]] = [
         "version": "2.15.0",
         "text": "הגרסה החדשה מתקדמת! עכשיו יש מסכי ניווט אמיתיים עם כוכבים, גביעים וכרטיסי משחק 🌟",
     },
-    {
-        "version": "2.14.1",
-        "text": "השרת מוכן להגיש את הגרסה החדשה! הוספנו API חדש ותמיכה בהרצת React מהשרת 🔧",
-    },
 ]
 
 # Available learning sessions (units), keyed by subject
@@ -87,10 +87,10 @@ TOPICS_BY_SUBJECT: Dict[str, List[Dict[str, Any]]] = {
 SESSIONS: List[Dict[str, Any]] = [s for sessions in SESSIONS_BY_SUBJECT.values() for s in sessions]
 
 # Valid session slugs for route validation
-VALID_SESSION_SLUGS: set = {s["slug"] for s in SESSIONS}
+VALID_SESSION_SLUGS: FrozenSet[str] = frozenset(s["slug"] for s in SESSIONS)
 
 # Valid subjects for route validation
-VALID_SUBJECTS: set = set(SESSIONS_BY_SUBJECT.keys())
+VALID_SUBJECTS: FrozenSet[str] = frozenset(SESSIONS_BY_SUBJECT)
 
 # Collectible reward tiers — unlocked at star milestones
 REWARD_TIERS: List[Dict[str, Any]] = [
@@ -13,6 +13,25 @@ import structlog
 from pythonjsonlogger import jsonlogger
 
 
+class RequestContextFilter(logging.Filter):
+    """
+    Copy structlog context variables onto stdlib log records.
+
+    The app logs through ``logging.getLogger``, so values bound with
+    ``structlog.contextvars`` (e.g. the request ID set by the request
+    middleware) would otherwise never reach the output. Records logged
+    outside a request get ``request_id="-"``.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in structlog.contextvars.get_contextvars().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        if not hasattr(record, "request_id"):
+            record.request_id = "-"
+        return True
+
+
 def setup_logging(log_level: str = "INFO", json_output: bool = False) -> None:
     """
     Configure structured logging for the application.
@@ -53,18 +72,19 @@ def setup_logging(log_level: str = "INFO", json_output: bool = False) -> None:
 
     # Configure Python's logging
     handler = logging.StreamHandler(sys.stdout)
+    handler.addFilter(RequestContextFilter())
 
     if json_output:
         # JSON formatter for production
         formatter = jsonlogger.JsonFormatter(
-            "%(timestamp)s %(level)s %(name)s %(message)s",
-            rename_fields={"levelname": "level", "name": "logger"},
+            "%(asctime)s %(levelname)s %(name)s %(request_id)s %(message)s",
+            rename_fields={"asctime": "timestamp", "levelname": "level", "name": "logger"},
         )
         handler.setFormatter(formatter)
     else:
         # Simple formatter for development
         formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         handler.setFormatter(formatter)
@@ -99,10 +119,13 @@ def bind_request_id(request_id: str) -> None:
     """
     Bind a request ID to the current logging context.
 
+    Other bound keys are left untouched. Prefer the scoped
+    ``structlog.contextvars.bound_contextvars`` in middleware so the ID is
+    unbound once the request finishes.
+
     Args:
         request_id: Unique request identifier
     """
-    structlog.contextvars.clear_contextvars()
     structlog.contextvars.bind_contextvars(request_id=request_id)
 
 
@@ -2,12 +2,14 @@
 App state model for persistent application-level settings.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
 
 from sqlalchemy import DateTime, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Mapped, Session, mapped_column
 
-from backend.models.base import Base
+from backend.models.base import Base, utc_now
 
 
 class AppState(Base):
@@ -27,8 +29,30 @@ class AppState(Base):
     key: Mapped[str] = mapped_column(String(50), nullable=False, unique=True, index=True)
     value: Mapped[str] = mapped_column(Text, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+        DateTime(timezone=True), default=utc_now, nullable=False
     )
 
     def __repr__(self) -> str:
         return f"<AppState(key={self.key}, value={self.value})>"
+
+    @classmethod
+    def upsert(cls, session: Session, key: str, value: str, updated_at: datetime) -> None:
+        """
+        Insert or update a state value in a single statement.
+
+        Uses INSERT ... ON CONFLICT (key) DO UPDATE, which is atomic under
+        concurrent writers and avoids a SELECT round trip.
+
+        Args:
+            session: Active SQLAlchemy session
+            key: State key
+            value: New state value
+            updated_at: Modification timestamp
+        """
+        insert = pg_insert if session.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(cls).values(key=key, value=value, updated_at=updated_at)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.key],
+            set_={"value": stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+        )
+        session.execute(stmt)
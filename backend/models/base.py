@@ -7,11 +7,12 @@ Uses SQLite for development, easily switchable to PostgreSQL for production.
 
 import os
 from contextlib import contextmanager
+from datetime import datetime, timezone
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import Connection, create_engine, event
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from backend.config import config
 
@@ -19,7 +20,23 @@ from backend.config import config
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
-    pass
+    @classmethod
+    def upgrade_schema(cls, conn: Connection) -> None:
+        """
+        Bring an existing table in line with the model.
+
+        Called by init_db() after create_all(). Models override this for
+        changes create_all() cannot apply to tables that already exist.
+        Must be idempotent — it runs on every application start.
+
+        Args:
+            conn: Connection inside the init_db() transaction
+        """
+
+
+def utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime (column default factory)."""
+    return datetime.now(timezone.utc)
 
 
 # Use centralized configuration for database settings
@@ -30,19 +47,50 @@ _is_sqlite = DATABASE_URL.startswith("sqlite")
 
 # Create engine with appropriate settings
 if _is_sqlite:
-    # SQLite: use StaticPool for thread safety, check_same_thread=False for Flask
+    # SQLite file databases get a real pool so concurrent requests don't queue
+    # on one shared connection (WAL lets readers run alongside the writer).
+    # In-memory databases must keep a single StaticPool connection, otherwise
+    # every checkout would open a fresh, empty database.
+    _is_memory = (
+        DATABASE_URL in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in DATABASE_URL
+    )
+    if _is_memory:
+        _pool_args: dict = {"poolclass": StaticPool}
+    else:
+        _pool_args = {
+            "poolclass": QueuePool,
+            "pool_size": config.db_pool_size,
+            "max_overflow": config.db_max_overflow,
+        }
     _engine = create_engine(
         DATABASE_URL,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
         echo=config.sql_echo,
+        **_pool_args,
     )
+
+    @event.listens_for(_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):  # type: ignore[no-untyped-def]
+        """Tune every new SQLite connection for a write-heavy workload.
+
+        WAL lets readers proceed during a write and, with synchronous=NORMAL,
+        commits no longer fsync on every transaction.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+        cursor.close()
+
 else:
     # PostgreSQL/other: use connection pooling
     _engine = create_engine(
         DATABASE_URL,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_recycle=1800,  # Recycle before the pooler drops idle connections
         pool_pre_ping=True,  # Verify connections before use
         echo=config.sql_echo,
     )
@@ -96,10 +144,16 @@ def session_scope() -> Generator[Session, None, None]:
 
 def init_db() -> None:
     """
-    Initialize the database by creating all tables.
+    Initialize the database and bring existing tables up to date.
+
+    Creates missing tables, adds indexes that were introduced after a
+    table was first created, then runs each model's upgrade_schema()
+    hook for changes create_all() cannot make (dropping obsolete
+    indexes, column type changes). Every step is idempotent, so this
+    is safe to call at each application startup.
 
-    This should be called once at application startup.
-    For production, use Alembic migrations instead.
+    The game tables have no Alembic revisions, so their schema changes
+    are applied here rather than through Alembic migrations.
     """
     # Ensure data directory exists for SQLite
     if _is_sqlite:
@@ -109,3 +163,13 @@ def init_db() -> None:
             os.makedirs(db_dir, exist_ok=True)
 
     Base.metadata.create_all(bind=_engine)
+
+    # create_all skips tables that already exist, so add any indexes
+    # introduced after the table was first created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=_engine, checkfirst=True)
+
+    with _engine.begin() as conn:
+        for mapper in Base.registry.mappers:
+            mapper.class_.upgrade_schema(conn)
@@ -3,13 +3,49 @@ Game result model for tracking learning progress.
 """
 
 import json
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import DateTime, Float, Integer, String, Text
+from sqlalchemy import JSON, Connection, DateTime, Dialect, Float, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator, TypeEngine
 
-from backend.models.base import Base
+from backend.models.base import Base, utc_now
+
+# Single-column indexes superseded by the composite indexes below;
+# upgrade_schema() drops them from databases created before the change
+OBSOLETE_INDEXES = (
+    "ix_game_results_category",
+    "ix_game_results_topic",
+    "ix_game_results_session_slug",
+    "ix_game_results_game_type",
+    "ix_game_results_user_id",
+)
+
+
+class JSONList(TypeDecorator):
+    """
+    JSON list column, stored as JSONB on PostgreSQL.
+
+    Older databases stored word_results as json.dumps TEXT. Until
+    GameResult.upgrade_schema() converts the column, psycopg2 returns
+    those values as raw strings, so they are decoded here and callers
+    always receive a list.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(JSON())
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        if isinstance(value, str):
+            return json.loads(value) if value else []
+        return value
 
 
 class GameResult(Base):
@@ -29,26 +65,64 @@ class GameResult(Base):
     """
 
     __tablename__ = "game_results"
+    __table_args__ = (
+        # Practiced words: WHERE session_slug = ? AND played_at > reset_at
+        Index("ix_game_results_session_played", "session_slug", "played_at"),
+        # Per-user progress: WHERE user_id = ? ORDER BY played_at DESC
+        Index("ix_game_results_user_played", "user_id", "played_at"),
+    )
 
     # Core fields
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    category: Mapped[str] = mapped_column(String(30), nullable=False, default="english", index=True)
-    topic: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)
-    session_slug: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)
-    game_type: Mapped[str] = mapped_column(String(30), nullable=False, index=True)
+    category: Mapped[str] = mapped_column(String(30), nullable=False, default="english")
+    topic: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    session_slug: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    game_type: Mapped[str] = mapped_column(String(30), nullable=False)
     score: Mapped[int] = mapped_column(Integer, nullable=False)
     max_score: Mapped[int] = mapped_column(Integer, nullable=False)
     accuracy: Mapped[float] = mapped_column(Float, nullable=False)
-    word_results: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    word_results: Mapped[List[Dict[str, Any]]] = mapped_column(
+        JSONList(), nullable=False, default=list
+    )
 
     # Future multi-user support
-    user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
+    user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Timestamp
     played_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+        DateTime(timezone=True), default=utc_now, nullable=False
     )
 
+    @classmethod
+    def upgrade_schema(cls, conn: Connection) -> None:
+        """
+        Drop obsolete indexes and convert a legacy TEXT word_results to JSONB.
+
+        Args:
+            conn: Connection inside the init_db() transaction
+        """
+        for name in OBSOLETE_INDEXES:
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+
+        # SQLite stores JSON as TEXT either way; only PostgreSQL needs converting
+        if conn.dialect.name != "postgresql":
+            return
+        data_type = conn.exec_driver_sql(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_schema = current_schema() "
+            "AND table_name = 'game_results' AND column_name = 'word_results'"
+        ).scalar()
+        if data_type in (None, "jsonb"):
+            return
+        # Casting through ::text keeps this valid if a concurrent worker
+        # converted the column between the check and the ALTER
+        conn.exec_driver_sql(
+            "ALTER TABLE game_results "
+            "ALTER COLUMN word_results DROP DEFAULT, "
+            "ALTER COLUMN word_results TYPE JSONB "
+            "USING COALESCE(NULLIF(word_results::text, ''), '[]')::jsonb"
+        )
+
     def __repr__(self) -> str:
         return (
             f"<GameResult(id={self.id}, game={self.game_type}, "
@@ -66,6 +140,6 @@ class GameResult(Base):
             "score": self.score,
             "max_score": self.max_score,
             "accuracy": self.accuracy,
-            "word_results": json.loads(self.word_results) if self.word_results else [],
+            "word_results": self.word_results or [],
             "played_at": self.played_at.isoformat() if self.played_at else None,
         }
@@ -2,11 +2,14 @@
 API routes for the English learning game.
 """
 
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from backend.defaults import (
     APP_CHANGELOG,
@@ -22,13 +25,30 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/game", tags=["game"])
 
+# Config only changes on deploy, so clients revalidate against the ETag
+CONFIG_CACHE_CONTROL = "no-cache"
+
 
 # --- Request/Response Models ---
 
 
+GameType = Literal[
+    "word_match",
+    "sentence_scramble",
+    "listen_choose",
+    "true_false",
+    "quick_solve",
+    "missing_number",
+    "true_false_math",
+    "bubble_pop",
+]
+
+
 class WordResult(BaseModel):
     """A single word result from a game round."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     word: str = Field(..., min_length=1)
     correct: bool
     category: str = Field(default="")
@@ -37,13 +57,19 @@ class WordResult(BaseModel):
 class SaveGameResultRequest(BaseModel):
     """Request body for saving a game result."""
 
-    game_type: str = Field(..., pattern="^(word_match|sentence_scramble|listen_choose|true_false|quick_solve|missing_number|true_false_math|bubble_pop)$")
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    game_type: GameType
     score: int = Field(..., ge=0)
     max_score: int = Field(..., gt=0)
     word_results: List[WordResult] = Field(default_factory=list)
     session_slug: Optional[str] = None
 
 
+# Built once so each request reuses the compiled list serializer
+_WORD_RESULTS_ADAPTER: TypeAdapter[List[WordResult]] = TypeAdapter(List[WordResult])
+
+
 class ProgressResponse(BaseModel):
     """Response body for progress endpoint."""
 
@@ -58,9 +84,12 @@ class ProgressResponse(BaseModel):
 
 # --- Endpoints ---
 
+# Handlers that touch the database are plain def so FastAPI runs them in
+# its threadpool instead of blocking the event loop on synchronous SQLAlchemy.
+
 
 @router.post("/result")
-async def save_game_result(request: SaveGameResultRequest) -> Dict[str, Any]:
+def save_game_result(request: SaveGameResultRequest) -> Dict[str, Any]:
     """
     Save a completed game result.
 
@@ -72,7 +101,7 @@ async def save_game_result(request: SaveGameResultRequest) -> Dict[str, Any]:
             game_type=request.game_type,
             score=request.score,
             max_score=request.max_score,
-            word_results=[w.model_dump() for w in request.word_results],
+            word_results=_WORD_RESULTS_ADAPTER.dump_python(request.word_results),
             session_slug=request.session_slug,
         )
         return {
@@ -85,7 +114,7 @@ async def save_game_result(request: SaveGameResultRequest) -> Dict[str, Any]:
 
 
 @router.get("/progress")
-async def get_progress() -> Dict[str, Any]:
+def get_progress() -> Dict[str, Any]:
     """
     Get overall learning progress.
 
@@ -105,7 +134,7 @@ async def get_progress() -> Dict[str, Any]:
 
 
 @router.get("/practiced-words")
-async def get_practiced_words(session_slug: Optional[str] = None) -> Dict[str, Any]:
+def get_practiced_words(session_slug: Optional[str] = None) -> Dict[str, Any]:
     """
     Get unique vocabulary words practiced since the last reset.
 
@@ -125,7 +154,7 @@ async def get_practiced_words(session_slug: Optional[str] = None) -> Dict[str, A
 
 
 @router.post("/reset")
-async def reset_practiced_words() -> Dict[str, Any]:
+def reset_practiced_words() -> Dict[str, Any]:
     """
     Reset practiced words for a fresh practice round.
 
@@ -144,25 +173,60 @@ async def reset_practiced_words() -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/config")
-async def get_config(subject: Optional[str] = None, session_slug: Optional[str] = None) -> Dict[str, Any]:
+@lru_cache(maxsize=128)
+def _config_payload(subject: Optional[str], session_slug: Optional[str]) -> Tuple[bytes, str]:
     """
-    Get app configuration for the React frontend.
+    Build the serialized config body and its ETag.
 
-    Returns reward tiers, sessions, version, and changelog that were
-    previously injected via Jinja2 template context.
+    The payload only depends on module constants and the query
+    parameters, so each combination is encoded once and reused.
+
+    Args:
+        subject: Subject query parameter
+        session_slug: Session slug query parameter
+
+    Returns:
+        Tuple of (JSON body bytes, quoted weak ETag)
     """
     sessions = SESSIONS_BY_SUBJECT.get(subject, []) if subject else SESSIONS_BY_SUBJECT
-    return {
-        "success": True,
-        "data": {
-            "version": APP_VERSION,
-            "changelog": APP_CHANGELOG,
-            "reward_tiers": REWARD_TIERS,
-            "sessions": sessions,
-            "sessions_by_subject": SESSIONS_BY_SUBJECT,
-            "topics_by_subject": TOPICS_BY_SUBJECT,
-            "subject": subject,
-            "session_slug": session_slug,
+    body = json.dumps(
+        {
+            "success": True,
+            "data": {
+                "version": APP_VERSION,
+                "changelog": APP_CHANGELOG,
+                "reward_tiers": REWARD_TIERS,
+                "sessions": sessions,
+                "sessions_by_subject": SESSIONS_BY_SUBJECT,
+                "topics_by_subject": TOPICS_BY_SUBJECT,
+                "subject": subject,
+                "session_slug": session_slug,
+            },
         },
-    }
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    return body, etag
+
+
+@router.get("/config", response_model=None)
+async def get_config(
+    request: Request,
+    subject: Optional[str] = None,
+    session_slug: Optional[str] = None,
+) -> Response:
+    """
+    Get app configuration for the React frontend.
+
+    Returns reward tiers, sessions, version, and changelog that were
+    previously injected via Jinja2 template context. Responds with
+    304 Not Modified when the client's If-None-Match matches the ETag.
+    """
+    body, etag = _config_payload(subject, session_slug)
+    headers = {"ETag": etag, "Cache-Control": CONFIG_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -5,8 +5,9 @@ Initializes Sentry SDK with data scrubbing and release tracking.
 No-op when SENTRY_DSN is not configured.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import sentry_sdk
 
@@ -39,9 +40,16 @@ SENSITIVE_KEYS = frozenset(
     }
 )
 
+# Exception types that signal shutdown or cancellation rather than a bug
+_DROP_EXC_TYPES = frozenset({KeyboardInterrupt, SystemExit, asyncio.CancelledError})
+
 
 def _scrub_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively scrub sensitive fields from a dictionary.
+    """Scrub sensitive fields from a dictionary and its nested dictionaries.
+
+    Walks nested dicts with an explicit worklist instead of recursion.
+    Keys already in lowercase (e.g. Starlette headers) match without
+    allocating a lowered copy.
 
     Args:
         data: Dictionary to scrub
@@ -50,13 +58,18 @@ def _scrub_data(data: Dict[str, Any]) -> Dict[str, Any]:
         Scrubbed dictionary with sensitive values replaced
     """
     scrubbed: Dict[str, Any] = {}
-    for key, value in data.items():
-        if key.lower() in SENSITIVE_KEYS:
-            scrubbed[key] = "[Filtered]"
-        elif isinstance(value, dict):
-            scrubbed[key] = _scrub_data(value)
-        else:
-            scrubbed[key] = value
+    stack: List[Tuple[Dict[str, Any], Dict[str, Any]]] = [(scrubbed, data)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if key in SENSITIVE_KEYS or key.lower() in SENSITIVE_KEYS:
+                dst[key] = "[Filtered]"
+            elif isinstance(value, dict):
+                child: Dict[str, Any] = {}
+                dst[key] = child
+                stack.append((child, value))
+            else:
+                dst[key] = value
     return scrubbed
 
 
@@ -70,17 +83,16 @@ def _before_send(event: Dict[str, Any], hint: Dict[str, Any]) -> Optional[Dict[s
     Returns:
         Scrubbed event, or None to drop it
     """
-    # Filter out KeyboardInterrupt (normal server shutdown via Ctrl+C)
-    if "exc_info" in hint:
-        exc_type = hint["exc_info"][0]
-        if exc_type is KeyboardInterrupt:
-            return None
+    # Filter out shutdown/cancellation exceptions (Ctrl+C, worker stop)
+    if "exc_info" in hint and hint["exc_info"][0] in _DROP_EXC_TYPES:
+        return None
 
     # Filter KeyboardInterrupt logged as message by uvicorn
-    log_entry = event.get("logentry", {})
-    message = log_entry.get("message", "") or log_entry.get("formatted", "")
-    if "KeyboardInterrupt" in message:
-        return None
+    log_entry = event.get("logentry")
+    if log_entry:
+        message = log_entry.get("message", "") or log_entry.get("formatted", "")
+        if "KeyboardInterrupt" in message:
+            return None
 
     # Scrub request data
     if "request" in event:
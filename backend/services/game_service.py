@@ -2,27 +2,29 @@
 Game service for tracking learning progress and game results.
 """
 
-import json
+import copy
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
-from sqlalchemy import func
+from cachetools import TTLCache
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 
 from backend.defaults import REWARD_TIERS
 from backend.exceptions import GameError
 from backend.models.app_state import AppState
-from backend.models.base import init_db, session_scope
+from backend.models.base import init_db, session_scope, utc_now
 from backend.models.game_result import GameResult
 
 logger = logging.getLogger(__name__)
 
 # Valid game types
-VALID_GAME_TYPES = {
+VALID_GAME_TYPES = frozenset({
     "word_match", "sentence_scramble", "listen_choose", "true_false",
     "quick_solve", "missing_number", "true_false_math", "bubble_pop",
-}
+})
 
 # Stars per correct answer by game type
 STARS_PER_CORRECT = {
@@ -37,8 +39,8 @@ STARS_PER_CORRECT = {
 }
 
 # Category (subject) by game type
-MATH_GAME_TYPES = {"quick_solve", "missing_number", "true_false_math", "bubble_pop"}
-ENGLISH_GAME_TYPES = {"word_match", "sentence_scramble", "listen_choose", "true_false"}
+MATH_GAME_TYPES = frozenset({"quick_solve", "missing_number", "true_false_math", "bubble_pop"})
+ENGLISH_GAME_TYPES = frozenset({"word_match", "sentence_scramble", "listen_choose", "true_false"})
 
 # Required game types per session slug prefix for completion
 REQUIRED_GAMES_BY_PREFIX = {
@@ -55,6 +57,13 @@ TOPIC_BY_SESSION: Dict[str, str] = {
     "math-primes": "Multiplication and Division",
 }
 
+# Max cached progress / practiced-words results (keyed by user and session)
+RESULT_CACHE_SIZE = 256
+
+# Upper bound on how long a cached result can outlive an out-of-band edit
+# (the fingerprint only detects new games and resets, not deletes/updates)
+RESULT_CACHE_TTL_SECONDS = 300
+
 # Rounds per game type
 ROUNDS_PER_GAME = {
     "word_match": 10,
@@ -68,6 +77,14 @@ ROUNDS_PER_GAME = {
 }
 
 
+class HistoryFingerprint(NamedTuple):
+    """Snapshot of the game history used to validate cached results."""
+
+    last_id: Optional[int]
+    last_played_at: Optional[datetime]
+    reset_at: Optional[datetime]
+
+
 class GameService:
     """Service for managing game results and progress tracking."""
 
@@ -77,6 +94,13 @@ class GameService:
         except SQLAlchemyError as e:
             raise GameError("initialization", str(e))
 
+        # Derived read results, each stored with the history fingerprint it
+        # was computed from so an entry is only served while it is current
+        self._result_cache: TTLCache = TTLCache(
+            maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL_SECONDS,
+        )
+        self._cache_lock = threading.Lock()
+
     def save_game_result(
         self,
         game_type: str,
@@ -121,7 +145,7 @@ class GameService:
                     score=score,
                     max_score=max_score,
                     accuracy=accuracy,
-                    word_results=json.dumps(word_results, ensure_ascii=False),
+                    word_results=word_results,
                     session_slug=session_slug,
                     user_id=user_id,
                 )
@@ -143,6 +167,9 @@ class GameService:
         """
         Get overall learning progress summary.
 
+        The summary is cached per user and reused until a game is saved
+        or practiced words are reset; each call returns its own copy.
+
         Args:
             user_id: Optional user ID filter
 
@@ -151,123 +178,165 @@ class GameService:
         """
         try:
             with session_scope() as session:
-                query = session.query(GameResult)
-                if user_id is not None:
-                    query = query.filter(GameResult.user_id == user_id)
-
-                results = query.order_by(GameResult.played_at.desc()).all()
-
-                if not results:
-                    return {
-                        "total_stars": 0,
-                        "games_played": 0,
-                        "accuracy_by_game": {},
-                        "stars_by_session": {},
-                        "completed_sessions": [],
-                        "weak_words": [],
-                        "recent_games": [],
-                        "earned_rewards": [],
-                        "next_reward": REWARD_TIERS[0],
-                    }
-
-                # Total stars
-                total_stars = sum(r.score for r in results)
-
-                # Accuracy by game type
-                accuracy_by_game: Dict[str, Dict[str, Any]] = {}
-                for game_type in VALID_GAME_TYPES:
-                    game_results = [r for r in results if r.game_type == game_type]
-                    if game_results:
-                        avg_accuracy = sum(r.accuracy for r in game_results) / len(game_results)
-                        accuracy_by_game[game_type] = {
-                            "games_played": len(game_results),
-                            "average_accuracy": round(avg_accuracy, 2),
-                            "total_stars": sum(r.score for r in game_results),
-                        }
-
-                # Weak words (words answered incorrectly most often)
-                word_stats: Dict[str, Dict[str, int]] = {}
-                for r in results:
-                    word_list = json.loads(r.word_results) if r.word_results else []
-                    for w in word_list:
-                        word = w.get("word", "")
-                        if not word:
-                            continue
-                        if word not in word_stats:
-                            word_stats[word] = {"correct": 0, "total": 0}
-                        word_stats[word]["total"] += 1
-                        if w.get("correct"):
-                            word_stats[word]["correct"] += 1
-
-                weak_words = []
-                for word, stats in word_stats.items():
-                    if stats["total"] >= 2:  # Only include words seen at least twice
-                        acc = stats["correct"] / stats["total"]
-                        if acc < 0.7:  # Below 70% accuracy
-                            weak_words.append({
-                                "word": word,
-                                "accuracy": round(acc, 2),
-                                "attempts": stats["total"],
-                            })
-                weak_words.sort(key=lambda w: w["accuracy"])
-
-                # Stars by session slug
-                stars_by_session: Dict[str, int] = {}
-                for r in results:
-                    slug = r.session_slug or "unknown"
-                    stars_by_session[slug] = stars_by_session.get(slug, 0) + r.score
-
-                # Recent games (last 10)
-                recent_games = [r.to_dict() for r in results[:10]]
-
-                # Earned rewards based on total stars
-                earned_rewards = [t["id"] for t in REWARD_TIERS if t["stars"] <= total_stars]
-                unearned = [t for t in REWARD_TIERS if t["stars"] > total_stars]
-                next_reward = unearned[0] if unearned else None
-
-                # Completed sessions — slugs where all required game types have been played
-                # Only count games played AFTER the last reset (stars are preserved,
-                # but completion resets so the child replays all 4 games with fresh words)
-                reset_at = self._get_reset_at(session)
-                # Strip timezone for comparison with naive SQLite datetimes
-                if reset_at and reset_at.tzinfo is not None:
-                    reset_at = reset_at.replace(tzinfo=None)
-                games_by_session: Dict[str, set] = {}
-                for r in results:
-                    if reset_at and r.played_at < reset_at:
-                        continue
-                    slug = r.session_slug
-                    if slug:
-                        if slug not in games_by_session:
-                            games_by_session[slug] = set()
-                        games_by_session[slug].add(r.game_type)
-
-                completed_sessions = []
-                for slug, played_types in games_by_session.items():
-                    # Match required games by slug prefix (math-* → MATH, jet* → ENGLISH)
-                    required = None
-                    for prefix, game_set in REQUIRED_GAMES_BY_PREFIX.items():
-                        if slug.startswith(prefix):
-                            required = game_set
-                            break
-                    if required and required.issubset(played_types):
-                        completed_sessions.append(slug)
-
-                return {
-                    "total_stars": total_stars,
-                    "games_played": len(results),
-                    "accuracy_by_game": accuracy_by_game,
-                    "stars_by_session": stars_by_session,
-                    "completed_sessions": completed_sessions,
-                    "weak_words": weak_words[:10],
-                    "recent_games": recent_games,
-                    "earned_rewards": earned_rewards,
-                    "next_reward": next_reward,
-                }
+                fingerprint = self._history_fingerprint(session, user_id)
+                key = ("progress", user_id)
+                progress = self._cached_result(key, fingerprint)
+                if progress is None:
+                    progress = self._build_progress(session, user_id, reset_at=fingerprint.reset_at)
+                    self._store_result(key, fingerprint, progress)
+                return progress
 
         except SQLAlchemyError as e:
             raise GameError("get_progress", str(e))
 
+    def _build_progress(
+        self, session: Any, user_id: Optional[int], reset_at: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """
+        Aggregate the progress summary from the full game history.
+
+        Args:
+            session: Active SQLAlchemy session
+            user_id: Optional user ID filter
+            reset_at: Current reset_at timestamp, or None if never reset
+
+        Returns:
+            Progress dict as returned by get_progress()
+        """
+        # Stream only the columns the aggregation needs as plain rows,
+        # skipping ORM object materialization for the full history
+        stmt = select(
+            GameResult.game_type,
+            GameResult.score,
+            GameResult.accuracy,
+            GameResult.word_results,
+            GameResult.session_slug,
+            GameResult.played_at,
+        )
+        if user_id is not None:
+            stmt = stmt.where(GameResult.user_id == user_id)
+        stmt = stmt.order_by(GameResult.played_at.desc())
+
+        # Completion only counts games played AFTER the last reset (stars
+        # are preserved, but completion resets so the child replays all 4
+        # games with fresh words)
+        # Strip timezone for comparison with naive SQLite datetimes
+        if reset_at and reset_at.tzinfo is not None:
+            reset_at = reset_at.replace(tzinfo=None)
+
+        # Aggregate every statistic in a single pass over the results
+        games_played = 0
+        total_stars = 0
+        game_stats: Dict[str, Dict[str, Any]] = {}
+        word_stats: Dict[str, Dict[str, int]] = {}
+        stars_by_session: Dict[str, int] = {}
+        games_by_session: Dict[str, Set[str]] = {}
+        for r in session.execute(stmt).yield_per(1000):
+            games_played += 1
+            total_stars += r.score
+
+            # Accuracy by game type
+            game = game_stats.get(r.game_type)
+            if game is None:
+                game = game_stats[r.game_type] = {"games": 0, "accuracy": 0.0, "stars": 0}
+            game["games"] += 1
+            game["accuracy"] += r.accuracy
+            game["stars"] += r.score
+
+            # Per-word correctness (for weak words)
+            for w in r.word_results or []:
+                word = w.get("word", "")
+                if not word:
+                    continue
+                if word not in word_stats:
+                    word_stats[word] = {"correct": 0, "total": 0}
+                word_stats[word]["total"] += 1
+                if w.get("correct"):
+                    word_stats[word]["correct"] += 1
+
+            # Stars by session slug
+            slug = r.session_slug or "unknown"
+            stars_by_session[slug] = stars_by_session.get(slug, 0) + r.score
+
+            # Game types played per session since the last reset
+            if r.session_slug and not (reset_at and r.played_at < reset_at):
+                if r.session_slug not in games_by_session:
+                    games_by_session[r.session_slug] = set()
+                games_by_session[r.session_slug].add(r.game_type)
+
+        if not games_played:
+            return {
+                "total_stars": 0,
+                "games_played": 0,
+                "accuracy_by_game": {},
+                "stars_by_session": {},
+                "completed_sessions": [],
+                "weak_words": [],
+                "recent_games": [],
+                "earned_rewards": [],
+                "next_reward": REWARD_TIERS[0],
+            }
+
+        accuracy_by_game: Dict[str, Dict[str, Any]] = {}
+        for game_type, game in game_stats.items():
+            if game_type not in VALID_GAME_TYPES:
+                continue
+            accuracy_by_game[game_type] = {
+                "games_played": game["games"],
+                "average_accuracy": round(game["accuracy"] / game["games"], 2),
+                "total_stars": game["stars"],
+            }
+
+        # Weak words (words answered incorrectly most often)
+        weak_words = []
+        for word, stats in word_stats.items():
+            if stats["total"] >= 2:  # Only include words seen at least twice
+                acc = stats["correct"] / stats["total"]
+                if acc < 0.7:  # Below 70% accuracy
+                    weak_words.append({
+                        "word": word,
+                        "accuracy": round(acc, 2),
+                        "attempts": stats["total"],
+                    })
+        weak_words.sort(key=lambda w: w["accuracy"])
+
+        # Recent games (last 10)
+        recent_query = session.query(GameResult)
+        if user_id is not None:
+            recent_query = recent_query.filter(GameResult.user_id == user_id)
+        recent_games = [
+            r.to_dict() for r in recent_query.order_by(GameResult.played_at.desc()).limit(10)
+        ]
+
+        # Earned rewards based on total stars
+        earned_rewards = [t["id"] for t in REWARD_TIERS if t["stars"] <= total_stars]
+        unearned = [t for t in REWARD_TIERS if t["stars"] > total_stars]
+        next_reward = unearned[0] if unearned else None
+
+        # Completed sessions — slugs where all required game types have been played
+        completed_sessions = []
+        for slug, played_types in games_by_session.items():
+            # Match required games by slug prefix (math-* → MATH, jet* → ENGLISH)
+            required = None
+            for prefix, game_set in REQUIRED_GAMES_BY_PREFIX.items():
+                if slug.startswith(prefix):
+                    required = game_set
+                    break
+            if required and required.issubset(played_types):
+                completed_sessions.append(slug)
+
+        return {
+            "total_stars": total_stars,
+            "games_played": games_played,
+            "accuracy_by_game": accuracy_by_game,
+            "stars_by_session": stars_by_session,
+            "completed_sessions": completed_sessions,
+            "weak_words": weak_words[:10],
+            "recent_games": recent_games,
+            "earned_rewards": earned_rewards,
+            "next_reward": next_reward,
+        }
+
     def _get_reset_at(self, session: Any) -> Optional[datetime]:
         """
         Get the current reset_at timestamp from app_state.
@@ -283,6 +352,72 @@ class GameService:
             return datetime.fromisoformat(row.value)
         return None
 
+    def _history_fingerprint(self, session: Any, user_id: Optional[int]) -> HistoryFingerprint:
+        """
+        Summarize the game history cheaply enough to validate cached results.
+
+        Game results are append-only, so the newest row identifies the
+        history: any saved game changes it, and any reset changes reset_at.
+        The newest row is found through an index (the primary key, or
+        (user_id, played_at) when filtering by user), so this costs a
+        couple of index lookups rather than a scan. Because it is read from
+        the database, writes from other worker processes are seen too.
+
+        Args:
+            session: Active SQLAlchemy session
+            user_id: Optional user ID filter
+
+        Returns:
+            HistoryFingerprint for the (optionally user-filtered) history
+        """
+        stmt = select(GameResult.id, GameResult.played_at)
+        if user_id is not None:
+            stmt = stmt.where(GameResult.user_id == user_id).order_by(
+                GameResult.played_at.desc(), GameResult.id.desc()
+            )
+        else:
+            stmt = stmt.order_by(GameResult.id.desc())
+        last = session.execute(stmt.limit(1)).first()
+        return HistoryFingerprint(
+            last_id=last.id if last else None,
+            last_played_at=last.played_at if last else None,
+            reset_at=self._get_reset_at(session),
+        )
+
+    def _cached_result(self, key: Tuple[Any, ...], fingerprint: HistoryFingerprint) -> Any:
+        """
+        Return a copy of a cached result if it was computed from the same history.
+
+        Args:
+            key: Cache key (result kind plus query arguments)
+            fingerprint: Current history fingerprint
+
+        Returns:
+            A deep copy of the cached result, or None on a miss or stale entry
+        """
+        with self._cache_lock:
+            entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        cached_fingerprint, result = entry
+        if cached_fingerprint != fingerprint:
+            return None
+        return copy.deepcopy(result)
+
+    def _store_result(
+        self, key: Tuple[Any, ...], fingerprint: HistoryFingerprint, result: Any
+    ) -> None:
+        """
+        Cache a private copy of a result with the fingerprint it came from.
+
+        Args:
+            key: Cache key (result kind plus query arguments)
+            fingerprint: History fingerprint the result was computed from
+            result: The computed result (the caller keeps the original)
+        """
+        with self._cache_lock:
+            self._result_cache[key] = (fingerprint, copy.deepcopy(result))
+
     def reset_practiced_words(self) -> str:
         """
         Start a fresh practice round by setting reset_at to now.
@@ -298,15 +433,10 @@ class GameService:
         """
         try:
             with session_scope() as session:
-                now = datetime.now(timezone.utc)
+                now = utc_now()
                 now_iso = now.isoformat()
 
-                row = session.query(AppState).filter(AppState.key == "reset_at").first()
-                if row:
-                    row.value = now_iso
-                    row.updated_at = now
-                else:
-                    session.add(AppState(key="reset_at", value=now_iso, updated_at=now))
+                AppState.upsert(session, "reset_at", now_iso, now)
 
                 logger.info(f"Practice round reset at {now_iso}")
                 return now_iso
@@ -321,7 +451,8 @@ class GameService:
         Get unique vocabulary words practiced since the last reset.
 
         Extracts words from the word_results JSON column of game results
-        played after the most recent reset_at timestamp.
+        played after the most recent reset_at timestamp. Cached like
+        get_progress(); each call returns its own list.
 
         Args:
             user_id: Optional user ID filter
@@ -332,29 +463,29 @@ class GameService:
         """
         try:
             with session_scope() as session:
-                reset_at = self._get_reset_at(session)
-
-                query = session.query(GameResult.word_results)
-                if user_id is not None:
-                    query = query.filter(GameResult.user_id == user_id)
-                if session_slug is not None:
-                    query = query.filter(GameResult.session_slug == session_slug)
-                if reset_at is not None:
-                    query = query.filter(GameResult.played_at > reset_at)
-
-                rows = query.all()
-
-                practiced: set[str] = set()
-                for (word_results_json,) in rows:
-                    if not word_results_json:
-                        continue
-                    word_list = json.loads(word_results_json)
-                    for w in word_list:
-                        word = w.get("word", "").strip()
-                        if word:
-                            practiced.add(word.lower())
-
-                return sorted(practiced)
+                fingerprint = self._history_fingerprint(session, user_id)
+                key = ("practiced_words", user_id, session_slug)
+                words = self._cached_result(key, fingerprint)
+                if words is None:
+                    reset_at = fingerprint.reset_at
+                    query = session.query(GameResult.word_results)
+                    if user_id is not None:
+                        query = query.filter(GameResult.user_id == user_id)
+                    if session_slug is not None:
+                        query = query.filter(GameResult.session_slug == session_slug)
+                    if reset_at is not None:
+                        query = query.filter(GameResult.played_at > reset_at)
+
+                    practiced: set[str] = set()
+                    for (word_list,) in query.all():
+                        for w in word_list or []:
+                            word = w.get("word", "").strip()
+                            if word:
+                                practiced.add(word.lower())
+
+                    words = sorted(practiced)
+                    self._store_result(key, fingerprint, words)
+                return words
 
         except SQLAlchemyError as e:
             raise GameError("get_practiced_words", str(e))
@@ -362,11 +493,18 @@ class GameService:
 
 # Singleton instance
 _game_service: Optional[GameService] = None
+_game_service_lock = threading.Lock()
 
 
 def get_game_service() -> GameService:
-    """Get or create the singleton GameService instance."""
+    """Get or create the singleton GameService instance.
+
+    Route handlers run in a threadpool, so creation is guarded by a lock to
+    avoid racing init_db() from concurrent first requests.
+    """
     global _game_service
     if _game_service is None:
-        _game_service = GameService()
+        with _game_service_lock:
+            if _game_service is None:
+                _game_service = GameService()
     return _game_service
@@ -1,14 +1,18 @@
 """FastAPI app for Ariel Learning App."""
 
 import logging
-import uuid
+import os
+import stat
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from secrets import token_hex
+from typing import Any, Dict, Optional
 
 import sentry_sdk
+import structlog
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from backend.config import config
@@ -35,6 +39,9 @@ init_sentry(
 # Initialize FastAPI app
 app = FastAPI(**APP_METADATA)
 
+# Compress JSON and static responses (skips tiny payloads)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Include API routers (must be before static file mounts)
 app.include_router(game_router)
 
@@ -81,10 +88,13 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
 @app.middleware("http")
 async def request_context_middleware(request: Request, call_next):  # type: ignore[no-untyped-def]
     """Attach request ID and Sentry context to each request."""
-    request_id = str(uuid.uuid4())[:8]
+    request_id = token_hex(4)
     request.state.request_id = request_id
 
-    with sentry_sdk.new_scope() as scope:
+    with (
+        sentry_sdk.new_scope() as scope,
+        structlog.contextvars.bound_contextvars(request_id=request_id),
+    ):
         scope.set_tag("request_id", request_id)
         scope.set_tag("endpoint", request.url.path)
         response = await call_next(request)
@@ -121,22 +131,64 @@ async def redirect_app_urls(full_path: str) -> RedirectResponse:
 # or static files from dist root (favicon, SVGs).
 
 REACT_DIST = Path("frontend/dist")
+
+# Vite fingerprints asset filenames with a content hash, so browsers may cache
+# them forever; index.html is revalidated on every load to pick up new builds.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+INDEX_CACHE_CONTROL = "no-cache"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for content-hashed build output, cacheable indefinitely."""
+
+    def file_response(self, *args: Any, **kwargs: Any) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+
 if REACT_DIST.is_dir():
-    app.mount("/assets", StaticFiles(directory=str(REACT_DIST / "assets")), name="react-assets")
+    app.mount(
+        "/assets",
+        ImmutableStaticFiles(directory=str(REACT_DIST / "assets")),
+        name="react-assets",
+    )
+
+
+def _stat_regular_file(path: Path) -> Optional[os.stat_result]:
+    """Stat a path once, returning None unless it is a regular file."""
+    try:
+        stat_result = path.stat()
+    except (OSError, ValueError):  # ValueError: embedded NUL byte
+        return None
+    return stat_result if stat.S_ISREG(stat_result.st_mode) else None
 
 
 @app.get("/{full_path:path}", response_class=HTMLResponse)
 async def react_spa(full_path: str) -> FileResponse:
     """Serve static files from dist or fall back to index.html for SPA routing."""
-    # First check if this is a real file in dist (favicon.png, SVGs)
-    file_path = REACT_DIST / full_path
-    if full_path and file_path.is_file():
-        return FileResponse(str(file_path))
+    # First check if this is a real file in dist (favicon.png, SVGs).
+    # The stat result is handed to FileResponse so it doesn't stat again.
+    file_stat = None
+    file_path: Optional[Path] = None
+    if full_path:
+        try:
+            file_path = (REACT_DIST / full_path).resolve()
+        except (OSError, ValueError):  # ValueError: embedded NUL byte ("%00")
+            pass
+        # Only serve files inside the build directory ("..%2f" must not escape it)
+        if file_path is not None and file_path.is_relative_to(REACT_DIST.resolve()):
+            file_stat = _stat_regular_file(file_path)
+    if file_stat is not None:
+        return FileResponse(str(file_path), stat_result=file_stat)
     # Otherwise serve index.html for React Router
     index_file = REACT_DIST / "index.html"
-    if not index_file.is_file():
+    index_stat = _stat_regular_file(index_file)
+    if index_stat is None:
         raise HTTPException(status_code=404, detail="React build not found. Run: cd frontend && npm run build")
-    return FileResponse(str(index_file))
+    return FileResponse(
+        str(index_file), stat_result=index_stat, headers={"Cache-Control": INDEX_CACHE_CONTROL}
+    )
 
 
 if __name__ == "__main__":
@@ -5,14 +5,18 @@ Tests the full request/response cycle through FastAPI's TestClient.
 """
 
 import time
+from typing import get_args
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from backend.models.app_state import AppState
 from backend.models.base import init_db, session_scope
 from backend.models.game_result import GameResult
-from backend.web_app import app
+from backend.routes.game import GameType, _config_payload
+from backend.services.game_service import VALID_GAME_TYPES
+from backend.web_app import ImmutableStaticFiles, app
 
 
 @pytest.fixture(autouse=True)
@@ -43,6 +47,13 @@ class TestHealthEndpoint:
         assert "version" in data
         assert "timestamp" in data
 
+    def test_request_id_header(self, client):
+        """Each response carries a short hex request ID."""
+        response = client.get("/health")
+        request_id = response.headers["x-request-id"]
+        assert len(request_id) == 8
+        int(request_id, 16)
+
 
 class TestSaveGameResultAPI:
     """Tests for POST /api/game/result."""
@@ -121,6 +132,24 @@ class TestSaveGameResultAPI:
         })
         assert response.status_code == 422
 
+    def test_unknown_fields_ignored(self, client):
+        """Extra fields in the body or word results are dropped, not stored."""
+        response = client.post("/api/game/result", json={
+            "game_type": "word_match",
+            "score": 1,
+            "max_score": 10,
+            "word_results": [{"word": "coat", "correct": True, "debug": "x"}],
+            "client_version": "1.0",
+        })
+        assert response.status_code == 200
+        assert response.json()["data"]["word_results"] == [
+            {"word": "coat", "correct": True, "category": ""},
+        ]
+
+    def test_game_type_literal_matches_service(self):
+        """The request model accepts exactly the game types the service knows."""
+        assert set(get_args(GameType)) == VALID_GAME_TYPES
+
     def test_negative_score_rejected(self, client):
         """Negative score returns 422."""
         response = client.post("/api/game/result", json={
@@ -364,6 +393,59 @@ class TestResetAPI:
         assert "coat" not in words
 
 
+class TestConfigAPI:
+    """Tests for GET /api/game/config."""
+
+    def test_config_has_etag(self, client):
+        """Config responses carry an ETag and require revalidation."""
+        response = client.get("/api/game/config?subject=english")
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.json()["data"]["subject"] == "english"
+
+    def test_matching_etag_returns_304(self, client):
+        """A matching If-None-Match returns 304 with no body."""
+        etag = client.get("/api/game/config").headers["etag"]
+        response = client.get("/api/game/config", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_payload_encoded_once(self, client):
+        """Repeat requests reuse the cached serialized body."""
+        _config_payload.cache_clear()
+        first = client.get("/api/game/config?subject=math")
+        second = client.get("/api/game/config?subject=math")
+        assert first.content == second.content
+        assert _config_payload.cache_info().hits == 1
+        assert second.json()["data"]["subject"] == "math"
+
+    def test_etag_varies_with_query(self, client):
+        """Different query parameters produce different ETags."""
+        english = client.get("/api/game/config?subject=english").headers["etag"]
+        math = client.get("/api/game/config?subject=math").headers["etag"]
+        assert english != math
+        response = client.get("/api/game/config?subject=math", headers={"If-None-Match": english})
+        assert response.status_code == 200
+
+
+class TestCompression:
+    """Tests for response compression."""
+
+    def test_large_json_response_is_gzipped(self, client):
+        """Config payload is gzip-encoded when the client accepts it."""
+        response = client.get("/api/game/config", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["success"] is True
+
+    def test_small_response_not_compressed(self, client):
+        """Responses under the size threshold are sent uncompressed."""
+        response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+
 class TestPageRoutes:
     """Tests for React SPA routes and backward-compatibility redirects."""
 
@@ -399,3 +481,70 @@ class TestPageRoutes:
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
+
+
+class TestStaticCaching:
+    """Tests for Cache-Control headers on built frontend files."""
+
+    def test_hashed_assets_are_immutable(self, tmp_path):
+        """Files under /assets are served with a long-lived immutable policy."""
+        (tmp_path / "index-abc123.js").write_text("console.log('hi')")
+        assets_app = FastAPI()
+        assets_app.mount("/assets", ImmutableStaticFiles(directory=str(tmp_path)))
+
+        response = TestClient(assets_app).get("/assets/index-abc123.js")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    def test_index_is_revalidated(self, client, tmp_path, monkeypatch):
+        """index.html must be revalidated so new builds are picked up."""
+        (tmp_path / "index.html").write_text('<div id="root"></div>')
+        monkeypatch.setattr("backend.web_app.REACT_DIST", tmp_path)
+
+        response = client.get("/learning")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_dist_root_file_served_directly(self, client, tmp_path, monkeypatch):
+        """Real files in the dist root (favicon, SVGs) are served as-is."""
+        (tmp_path / "index.html").write_text('<div id="root"></div>')
+        (tmp_path / "favicon.png").write_bytes(b"\x89PNG")
+        monkeypatch.setattr("backend.web_app.REACT_DIST", tmp_path)
+
+        response = client.get("/favicon.png")
+        assert response.status_code == 200
+        assert response.content == b"\x89PNG"
+        assert response.headers["content-length"] == "4"
+
+    def test_path_traversal_not_served(self, client, tmp_path, monkeypatch):
+        """Encoded ../ segments cannot read files outside the dist directory."""
+        dist = tmp_path / "dist"
+        dist.mkdir()
+        (dist / "index.html").write_text('<div id="root"></div>')
+        (tmp_path / "secret.txt").write_text("top secret")
+        monkeypatch.setattr("backend.web_app.REACT_DIST", dist)
+
+        for path in ["/..%2fsecret.txt", "/assets/..%2f..%2fsecret.txt", "/..%2f..%2fetc%2fpasswd"]:
+            response = client.get(path)
+            assert "top secret" not in response.text
+            assert "root:" not in response.text
+        assert 'id="root"' in client.get("/..%2fsecret.txt").text
+
+    def test_nul_byte_path_falls_back_to_index(self, client, tmp_path, monkeypatch):
+        """Paths with an embedded NUL byte get the SPA fallback, not a 500."""
+        dist = tmp_path / "dist"
+        dist.mkdir()
+        (dist / "index.html").write_text('<div id="root"></div>')
+        monkeypatch.setattr("backend.web_app.REACT_DIST", dist)
+
+        for path in ["/%00", "/a%00b"]:
+            response = client.get(path)
+            assert response.status_code == 200
+            assert 'id="root"' in response.text
+
+    def test_missing_build_returns_404(self, client, tmp_path, monkeypatch):
+        """Without a built index.html the SPA route returns 404."""
+        monkeypatch.setattr("backend.web_app.REACT_DIST", tmp_path)
+
+        response = client.get("/learning")
+        assert response.status_code == 404
@@ -70,3 +70,15 @@ class TestAppConfigValidation:
         """Port 65535 is valid."""
         config = AppConfig(flask_port=65535)
         config.validate()  # Should not raise
+
+    def test_pool_size_zero_raises(self):
+        """Pool size 0 raises ConfigurationError."""
+        config = AppConfig(db_pool_size=0)
+        with pytest.raises(ConfigurationError, match="db_pool_size"):
+            config.validate()
+
+    def test_negative_max_overflow_raises(self):
+        """Negative max overflow raises ConfigurationError."""
+        config = AppConfig(db_max_overflow=-1)
+        with pytest.raises(ConfigurationError, match="db_max_overflow"):
+            config.validate()
@@ -280,6 +280,16 @@ class TestResetPracticedWords:
         parsed = datetime.fromisoformat(reset_at)
         assert parsed is not None
 
+    def test_repeated_reset_updates_single_row(self, game_service):
+        """Resetting twice updates the existing reset_at row instead of adding one."""
+        game_service.reset_practiced_words()
+        time.sleep(0.01)
+        second = game_service.reset_practiced_words()
+        with session_scope() as session:
+            rows = session.query(AppState).filter(AppState.key == "reset_at").all()
+            assert len(rows) == 1
+            assert rows[0].value == second
+
     def test_practiced_words_empty_after_reset(self, game_service):
         """Words played before reset don't appear in practiced words."""
         game_service.save_game_result(
@@ -418,3 +428,104 @@ class TestEarnedRewards:
         progress = game_service.get_progress()
         assert len(progress["earned_rewards"]) == 6
         assert progress["next_reward"] is None
+
+
+class TestResultCache:
+    """Tests for caching of progress and practiced-words results."""
+
+    def test_progress_reused_while_history_unchanged(self, game_service, monkeypatch):
+        """A second get_progress() with no new games skips the aggregation."""
+        game_service.save_game_result(
+            game_type="word_match", score=5, max_score=10, word_results=[],
+        )
+        first = game_service.get_progress()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("progress was recomputed")
+
+        monkeypatch.setattr(game_service, "_build_progress", fail)
+        assert game_service.get_progress() == first
+
+    def test_returned_results_are_independent_copies(self, game_service):
+        """Mutating a returned result does not leak into later calls."""
+        game_service.save_game_result(
+            game_type="word_match",
+            score=5,
+            max_score=10,
+            word_results=[{"word": "coat", "correct": True, "category": "clothes"}],
+        )
+        progress = game_service.get_progress()
+        progress["total_stars"] = 999
+        progress["recent_games"].clear()
+        words = game_service.get_practiced_words()
+        words.append("hacked")
+
+        assert game_service.get_progress()["total_stars"] == 5
+        assert len(game_service.get_progress()["recent_games"]) == 1
+        assert game_service.get_practiced_words() == ["coat"]
+
+    def test_reused_row_id_invalidates(self, game_service):
+        """A new row reusing a deleted row's id (SQLite) still refreshes the cache."""
+        game_service.save_game_result(
+            game_type="word_match", score=5, max_score=10, word_results=[],
+        )
+        assert game_service.get_progress()["total_stars"] == 5
+
+        with session_scope() as session:
+            session.query(GameResult).delete()
+        time.sleep(0.01)
+        game_service.save_game_result(
+            game_type="word_match", score=2, max_score=10, word_results=[],
+        )
+        assert game_service.get_progress()["total_stars"] == 2
+
+    def test_progress_refreshes_after_save(self, game_service):
+        """Saving a game invalidates the cached progress."""
+        game_service.save_game_result(
+            game_type="word_match", score=5, max_score=10, word_results=[],
+        )
+        assert game_service.get_progress()["total_stars"] == 5
+
+        game_service.save_game_result(
+            game_type="word_match", score=3, max_score=10, word_results=[],
+        )
+        assert game_service.get_progress()["total_stars"] == 8
+
+    def test_progress_sees_writes_from_other_processes(self, game_service):
+        """Rows written outside this service instance still invalidate the cache."""
+        assert game_service.get_progress()["games_played"] == 0
+
+        with session_scope() as session:
+            session.add(GameResult(
+                category="english", game_type="word_match", score=4,
+                max_score=10, accuracy=0.4, word_results=[],
+            ))
+
+        assert game_service.get_progress()["games_played"] == 1
+
+    def test_practiced_words_refresh_after_reset(self, game_service):
+        """Resetting invalidates cached practiced words."""
+        game_service.save_game_result(
+            game_type="word_match",
+            score=1,
+            max_score=10,
+            word_results=[{"word": "coat", "correct": True, "category": "clothes"}],
+        )
+        assert game_service.get_practiced_words() == ["coat"]
+
+        time.sleep(0.01)
+        game_service.reset_practiced_words()
+        assert game_service.get_practiced_words() == []
+
+    def test_practiced_words_cached_per_session(self, game_service):
+        """Different session filters are cached separately."""
+        game_service.save_game_result(
+            game_type="word_match",
+            score=1,
+            max_score=10,
+            word_results=[{"word": "coat", "correct": True, "category": "clothes"}],
+            session_slug="jet2-unit2",
+        )
+        assert game_service.get_practiced_words(session_slug="jet2-unit2") == ["coat"]
+        assert game_service.get_practiced_words(session_slug="other") == []
+        assert game_service.get_practiced_words() == ["coat"]
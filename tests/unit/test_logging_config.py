@@ -0,0 +1,79 @@
+"""
+Tests for structured logging helpers.
+"""
+
+import json
+import logging
+
+import structlog
+
+from backend.logging_config import RequestContextFilter, bind_request_id, setup_logging
+
+
+class TestBindRequestId:
+    """Tests for bind_request_id()."""
+
+    def setup_method(self):
+        structlog.contextvars.clear_contextvars()
+
+    def teardown_method(self):
+        structlog.contextvars.clear_contextvars()
+
+    def test_binds_request_id(self):
+        """Request ID is added to the logging context."""
+        bind_request_id("abc12345")
+        assert structlog.contextvars.get_contextvars()["request_id"] == "abc12345"
+
+    def test_preserves_other_bound_keys(self):
+        """Binding a request ID doesn't wipe keys bound earlier."""
+        structlog.contextvars.bind_contextvars(user_id=7)
+        bind_request_id("abc12345")
+        context = structlog.contextvars.get_contextvars()
+        assert context["user_id"] == 7
+        assert context["request_id"] == "abc12345"
+
+
+class TestRequestContextFilter:
+    """Tests for RequestContextFilter and its use in setup_logging()."""
+
+    def setup_method(self):
+        structlog.contextvars.clear_contextvars()
+
+    def teardown_method(self):
+        structlog.contextvars.clear_contextvars()
+        setup_logging()
+
+    def _record(self):
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello", None, None)
+        RequestContextFilter().filter(record)
+        return record
+
+    def test_copies_bound_context_to_record(self):
+        """Values bound via structlog contextvars appear on stdlib records."""
+        with structlog.contextvars.bound_contextvars(request_id="abc12345"):
+            record = self._record()
+        assert record.request_id == "abc12345"
+
+    def test_defaults_request_id_outside_requests(self):
+        """Records logged outside a request get a placeholder request ID."""
+        assert self._record().request_id == "-"
+
+    def test_json_output_includes_request_id(self, capsys):
+        """JSON logs carry the bound request ID and renamed standard fields."""
+        setup_logging(json_output=True)
+        with structlog.contextvars.bound_contextvars(request_id="abc12345"):
+            logging.getLogger("backend.test").info("hello")
+
+        line = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert line["request_id"] == "abc12345"
+        assert line["level"] == "INFO"
+        assert line["logger"] == "backend.test"
+        assert line["message"] == "hello"
+
+    def test_console_output_includes_request_id(self, capsys):
+        """Development logs show the bound request ID."""
+        setup_logging()
+        with structlog.contextvars.bound_contextvars(request_id="abc12345"):
+            logging.getLogger("backend.test").info("hello")
+
+        assert "[abc12345] hello" in capsys.readouterr().out
@@ -2,7 +2,11 @@
 Tests for database models.
 """
 
-from backend.models.base import init_db, session_scope
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects.postgresql import psycopg2
+from sqlalchemy.pool import QueuePool
+
+from backend.models.base import get_engine, init_db, session_scope
 from backend.models.game_result import GameResult
 
 
@@ -18,7 +22,7 @@ class TestGameResultModel:
                 score=8,
                 max_score=10,
                 accuracy=0.8,
-                word_results="[]",
+                word_results=[],
             )
             session.add(result)
             session.flush()
@@ -37,7 +41,7 @@ class TestGameResultModel:
                 score=7,
                 max_score=10,
                 accuracy=0.7,
-                word_results='[{"word": "coat", "correct": true}]',
+                word_results=[{"word": "coat", "correct": True}],
             )
             session.add(result)
             session.flush()
@@ -62,7 +66,7 @@ class TestGameResultModel:
                 score=5,
                 max_score=8,
                 accuracy=0.625,
-                word_results="",
+                word_results=None,
             )
             session.add(result)
             session.flush()
@@ -70,3 +74,135 @@ class TestGameResultModel:
 
             d = result.to_dict()
             assert d["word_results"] == []
+
+    def test_reads_word_results_stored_as_json_text(self):
+        """Rows written as json.dumps text before the JSON column still load as lists."""
+        init_db()
+        with session_scope() as session:
+            session.execute(
+                text(
+                    "INSERT INTO game_results "
+                    "(category, game_type, score, max_score, accuracy, word_results, played_at) "
+                    "VALUES ('english', 'word_match', 1, 1, 1.0, :wr, CURRENT_TIMESTAMP)"
+                ),
+                {"wr": '[{"word": "coat", "correct": true}]'},
+            )
+            result = session.query(GameResult).order_by(GameResult.id.desc()).first()
+            assert result.word_results == [{"word": "coat", "correct": True}]
+
+
+class _RecordingConnection:
+    """Minimal PostgreSQL connection stand-in that records executed SQL."""
+
+    class _Result:
+        def __init__(self, value):
+            self._value = value
+
+        def scalar(self):
+            return self._value
+
+    def __init__(self, data_type):
+        self.dialect = psycopg2.dialect()
+        self.data_type = data_type
+        self.statements = []
+
+    def exec_driver_sql(self, sql):
+        self.statements.append(sql)
+        return self._Result(self.data_type if "information_schema" in sql else None)
+
+
+class TestWordResultsPostgres:
+    """Tests for word_results on the PostgreSQL code path."""
+
+    def _load(self, value):
+        """Run a raw DB value through the psycopg2 result processing."""
+        dialect = psycopg2.dialect()
+        column_type = GameResult.__table__.c.word_results.type
+        processor = column_type.dialect_impl(dialect).result_processor(dialect, None)
+        return processor(value) if processor else value
+
+    def test_column_is_jsonb(self):
+        """New PostgreSQL tables get a JSONB column."""
+        dialect = psycopg2.dialect()
+        column_type = GameResult.__table__.c.word_results.type
+        assert column_type.compile(dialect=dialect) == "JSONB"
+
+    def test_decodes_legacy_text_value(self):
+        """A still-TEXT column returns json.dumps strings; they load as lists."""
+        loaded = self._load('[{"word": "coat", "correct": true}]')
+        assert loaded == [{"word": "coat", "correct": True}]
+        assert self._load("") == []
+
+    def test_passes_through_decoded_jsonb(self):
+        """JSONB values already decoded by psycopg2 are returned unchanged."""
+        value = [{"word": "coat", "correct": True}]
+        assert self._load(value) is value
+
+    def test_upgrade_converts_text_column(self):
+        """upgrade_schema alters a TEXT word_results column to JSONB."""
+        conn = _RecordingConnection("text")
+        GameResult.upgrade_schema(conn)
+        assert any("TYPE JSONB" in sql for sql in conn.statements)
+
+    def test_upgrade_skips_jsonb_column(self):
+        """upgrade_schema leaves an already-converted column alone."""
+        conn = _RecordingConnection("jsonb")
+        GameResult.upgrade_schema(conn)
+        assert not any("ALTER TABLE" in sql for sql in conn.statements)
+
+
+class TestSqliteEngine:
+    """Tests for SQLite engine configuration."""
+
+    def test_connection_pragmas(self):
+        """New SQLite connections use WAL with relaxed fsync."""
+        with get_engine().connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            # synchronous: 1 = NORMAL
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+            # temp_store: 2 = MEMORY
+            assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2
+
+    def test_file_database_uses_queue_pool(self):
+        """File-backed SQLite uses a real pool instead of one shared connection."""
+        assert isinstance(get_engine().pool, QueuePool)
+
+
+class TestInitDb:
+    """Tests for init_db()."""
+
+    def test_creates_composite_indexes(self):
+        """Composite game_results indexes exist after init_db."""
+        init_db()
+        index_names = {ix["name"] for ix in inspect(get_engine()).get_indexes("game_results")}
+        assert "ix_game_results_session_played" in index_names
+        assert "ix_game_results_user_played" in index_names
+
+    def test_adds_missing_index_to_existing_table(self):
+        """init_db recreates an index missing from an already-created table."""
+        init_db()
+        with get_engine().begin() as conn:
+            conn.exec_driver_sql("DROP INDEX ix_game_results_session_played")
+        init_db()
+        index_names = {ix["name"] for ix in inspect(get_engine()).get_indexes("game_results")}
+        assert "ix_game_results_session_played" in index_names
+
+    def test_drops_obsolete_single_column_indexes(self):
+        """Single-column indexes superseded by composites are removed."""
+        init_db()
+        with get_engine().begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS ix_game_results_category ON game_results (category)"
+            )
+        init_db()
+        index_names = {ix["name"] for ix in inspect(get_engine()).get_indexes("game_results")}
+        assert "ix_game_results_category" not in index_names
+
+    def test_runs_model_upgrade_hooks(self, monkeypatch):
+        """init_db calls each model's upgrade_schema hook with a connection."""
+        calls = []
+        monkeypatch.setattr(
+            GameResult, "upgrade_schema", classmethod(lambda cls, conn: calls.append(conn))
+        )
+        init_db()
+        assert len(calls) == 1
@@ -0,0 +1,84 @@
+"""
+Tests for Sentry event scrubbing.
+"""
+
+import asyncio
+
+from backend.sentry_config import _before_send, _scrub_data
+
+
+class TestScrubData:
+    """Tests for _scrub_data()."""
+
+    def test_filters_sensitive_keys(self):
+        """Sensitive keys are replaced regardless of case."""
+        scrubbed = _scrub_data({"password": "x", "Authorization": "Bearer y", "name": "Ariel"})
+        assert scrubbed == {
+            "password": "[Filtered]",
+            "Authorization": "[Filtered]",
+            "name": "Ariel",
+        }
+
+    def test_scrubs_nested_dicts(self):
+        """Sensitive keys are filtered at any nesting depth."""
+        data = {"outer": {"inner": {"api_key": "k", "keep": 1}, "token": "t"}, "ok": True}
+        assert _scrub_data(data) == {
+            "outer": {"inner": {"api_key": "[Filtered]", "keep": 1}, "token": "[Filtered]"},
+            "ok": True,
+        }
+
+    def test_does_not_mutate_input(self):
+        """The original dictionary is left untouched."""
+        data = {"nested": {"secret": "s"}}
+        _scrub_data(data)
+        assert data == {"nested": {"secret": "s"}}
+
+    def test_handles_deep_nesting(self):
+        """Deeply nested payloads do not hit the recursion limit."""
+        data: dict = {}
+        node = data
+        for _ in range(5000):
+            node["child"] = {}
+            node = node["child"]
+        node["token"] = "t"
+
+        node = _scrub_data(data)
+        for _ in range(5000):
+            node = node["child"]
+        assert node == {"token": "[Filtered]"}
+
+
+class TestBeforeSend:
+    """Tests for _before_send()."""
+
+    def test_scrubs_request_headers_and_cookies(self):
+        """Request headers are scrubbed and cookies are dropped."""
+        event = {
+            "request": {
+                "headers": {"cookie": "a=b", "user-agent": "test"},
+                "cookies": {"a": "b"},
+            },
+        }
+        result = _before_send(event, {})
+        assert result["request"]["headers"] == {"cookie": "[Filtered]", "user-agent": "test"}
+        assert result["request"]["cookies"] == "[Filtered]"
+
+    def test_drops_keyboard_interrupt(self):
+        """Server shutdown via Ctrl+C is not reported."""
+        hint = {"exc_info": (KeyboardInterrupt, KeyboardInterrupt(), None)}
+        assert _before_send({}, hint) is None
+
+    def test_drops_shutdown_and_cancellation(self):
+        """SystemExit and task cancellation are not reported."""
+        for exc_type in (SystemExit, asyncio.CancelledError):
+            assert _before_send({}, {"exc_info": (exc_type, exc_type(), None)}) is None
+
+    def test_drops_keyboard_interrupt_log_message(self):
+        """KeyboardInterrupt logged by uvicorn as a message is dropped."""
+        event = {"logentry": {"message": "Traceback ... KeyboardInterrupt"}}
+        assert _before_send(event, {}) is None
+
+    def test_keeps_regular_errors(self):
+        """Ordinary exceptions are still sent."""
+        event = {"logentry": {"message": "Failed to save game result"}}
+        assert _before_send(event, {"exc_info": (ValueError, ValueError(), None)}) is event